@@ -206,9 +206,11 @@ class ResizingGraphicsView(QGraphicsView):
         self.padding = 0.05  # fraction of the bounding rect
 
     def resizeEvent(self, event: QResizeEvent | None) -> None:
-        if not (scene := self.scene()):
+        if not self.scene():
             return
-        rect = scene.itemsBoundingRect()
+        # subclasses set the scene rect to the bounds of their items when drawing,
+        # so there is no need to visit every item again on each resize
+        rect = self.sceneRect()
         xmargin = rect.width() * self.padding
         ymargin = rect.height() * self.padding
         margins = QMarginsF(xmargin, ymargin, xmargin, ymargin)
@@ -5,7 +5,7 @@ from typing import Union
 from fonticon_mdi6 import MDI6
 from pymmcore_plus import CMMCorePlus
 from qtpy.QtCore import QSize, Qt
-from qtpy.QtGui import QColor
+from qtpy.QtGui import QColor, QIcon
 from qtpy.QtWidgets import QPushButton, QWidget
 from superqt.fonticon import icon
 
@@ -59,6 +59,12 @@ class LiveButton(QPushButton):
         self._button_text_off: str = "Stop"
         self._icon_color_on: COLOR_TYPE = (0, 255, 0)
         self._icon_color_off: COLOR_TYPE = "magenta"
+        # icons are rebuilt only when their color changes, not on every toggle
+        self._icon_on: QIcon = icon(MDI6.video_outline, color=self._icon_color_on)
+        self._icon_off: QIcon = icon(MDI6.video_off_outline, color=self._icon_color_off)
+        # whether the button is currently showing the live (running) state. Kept in
+        # sync by `_set_icon_state` so the setters below don't query the core.
+        self._is_running: bool = False
 
         self.streaming_timer = None
 
@@ -87,7 +93,7 @@ class LiveButton(QPushButton):
 
     @button_text_on.setter
     def button_text_on(self, text: str) -> None:
-        if not self._mmc.isSequenceRunning():
+        if not self._is_running:
             self.setText(text)
         self._button_text_on = text
 
@@ -102,7 +108,7 @@ class LiveButton(QPushButton):
 
     @button_text_off.setter
     def button_text_off(self, text: str) -> None:
-        if self._mmc.isSequenceRunning():
+        if self._is_running:
             self.setText(text)
         self._button_text_off = text
 
@@ -117,8 +123,9 @@ class LiveButton(QPushButton):
 
     @icon_color_on.setter
     def icon_color_on(self, color: COLOR_TYPE) -> None:
-        if not self._mmc.isSequenceRunning():
-            self.setIcon(icon(MDI6.video_outline, color=color))
+        self._icon_on = icon(MDI6.video_outline, color=color)
+        if not self._is_running:
+            self.setIcon(self._icon_on)
         self._icon_color_on = color
 
     @property
@@ -132,8 +139,9 @@ class LiveButton(QPushButton):
 
     @icon_color_off.setter
     def icon_color_off(self, color: COLOR_TYPE) -> None:
-        if self._mmc.isSequenceRunning():
-            self.setIcon(icon(MDI6.video_off_outline, color=color))
+        self._icon_off = icon(MDI6.video_off_outline, color=color)
+        if self._is_running:
+            self.setIcon(self._icon_off)
         self._icon_color_off = color
 
     def _create_button(self) -> None:
@@ -157,11 +165,12 @@ class LiveButton(QPushButton):
 
     def _set_icon_state(self, state: bool) -> None:
         """Set the icon in the on or off state."""
+        self._is_running = state
         if state:  # set in the off mode
-            self.setIcon(icon(MDI6.video_off_outline, color=self._icon_color_off))
+            self.setIcon(self._icon_off)
             self.setText(self._button_text_off)
         else:  # set in the on mode
-            self.setIcon(icon(MDI6.video_outline, color=self._icon_color_on))
+            self.setIcon(self._icon_on)
             self.setText(self._button_text_on)
 
     def _on_sequence_started(self) -> None:
@@ -36,6 +36,8 @@ class HCSWizard(QWizard):
         super().__init__(parent)
         self._mmc = mmcore or CMMCorePlus.instance()
         self._calibrated: bool = False
+        # the plate last synchronized with the calibration and points plan pages
+        self._plate: useq.WellPlate | None = None
 
         self.setWizardStyle(QWizard.WizardStyle.ModernStyle)
         self.setWindowTitle("HCS Wizard")
@@ -98,6 +100,9 @@ class HCSWizard(QWizard):
         """Set the state of the wizard to a WellPlatePlan."""
         self.plate_page.widget.setValue(value)
         self.calibration_page.widget.setValue(value)
+        # the plate page doesn't necessarily emit valueChanged on setValue, so make
+        # sure the points plan (and the cached plate) are synced with the new plate
+        self._on_plate_changed(value)
         # update the points plan fov size if it's not set
         point_plan = value.well_points_plan
         if point_plan.fov_width is None or point_plan.fov_height is None:
@@ -129,6 +134,13 @@ class HCSWizard(QWizard):
 
     def _on_plate_changed(self, plate_plan: useq.WellPlatePlan) -> None:
         """Synchronize the points plan with the well size/shape."""
+        # valueChanged is also emitted on every well selection change (e.g. for each
+        # mouse move while dragging over the plate), but nothing here depends on the
+        # selected wells, so only resync when the plate itself changes.
+        if plate_plan.plate == self._plate:
+            return
+        self._plate = plate_plan.plate
+
         # update the calibration widget with the new plate if it's different
         current_calib_plan = self.calibration_page.widget.value()
         if current_calib_plan is None or current_calib_plan.plate != plate_plan.plate:
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+from bisect import bisect_left, insort
+from typing import TYPE_CHECKING
 
 import numpy as np
 import useq
 from qtpy.QtCore import QRect, QRectF, QSize, Qt, Signal
-from qtpy.QtGui import QColor, QFont, QMouseEvent, QPainter, QPen
+from qtpy.QtGui import (
+    QColor,
+    QFont,
+    QFontMetricsF,
+    QMouseEvent,
+    QPainter,
+    QPainterPath,
+    QPen,
+)
 from qtpy.QtWidgets import (
     QAbstractGraphicsShapeItem,
     QAbstractItemView,
@@ -18,6 +27,7 @@ from qtpy.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
+    QStyleOptionGraphicsItem,
     QVBoxLayout,
     QWidget,
 )
@@ -26,7 +36,7 @@ from superqt.utils import signals_blocked
 from pymmcore_widgets._util import ResizingGraphicsView
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Iterable, Mapping, Sequence
 
     from qtpy.QtGui import QMouseEvent
 
@@ -157,7 +167,10 @@ class WellPlateWidget(QWidget):
             The plate information to set containing the plate and the selected wells
             as a list of (name, row, column).
         """
-        if isinstance(value, useq.WellPlate):
+        if isinstance(value, useq.WellPlatePlan):
+            # already validated (and immutable), no need to validate it again
+            plan = value
+        elif isinstance(value, useq.WellPlate):
             plan = useq.WellPlatePlan(plate=value, a1_center_xy=(0, 0))
         else:
             plan = useq.WellPlatePlan.model_validate(value)
@@ -176,9 +189,21 @@ class WellPlateWidget(QWidget):
 
     def _update_view(self, value: bool | useq.WellPlatePlan | None = None) -> None:
         rot = self._rotation if self._show_rotation_cb.isChecked() else None
-        plan = value if isinstance(value, useq.WellPlatePlan) else self.value()
-        val = plan.model_copy(update={"rotation": rot})
-        self._view.drawPlate(val)
+        if not isinstance(value, useq.WellPlatePlan):
+            # the rotation checkbox was toggled: the plate geometry is unchanged
+            self._view.applyRotation(rot or 0.0)
+            return
+        plan = value
+        if plan.rotation != rot:
+            # NOTE: not using model_copy here, as it would carry over the cached
+            # (rotated) well coordinates of the original plan
+            plan = useq.WellPlatePlan(
+                plate=plan.plate,
+                a1_center_xy=plan.a1_center_xy,
+                rotation=rot,
+                selected_wells=plan.selected_wells,
+            )
+        self._view.drawPlate(plan)
 
     def currentSelection(self) -> tuple[tuple[int, int], ...]:
         """Return the indices of the selected wells as `((row, col), ...)`."""
@@ -208,10 +233,17 @@ class WellPlateWidget(QWidget):
         self.valueChanged.emit(self.value())
 
     def _on_plate_name_changed(self, plate_name: str) -> None:
-        self._view.clearSelection()
-        plate = useq.WellPlate.from_str(plate_name)
-        val = self.value().model_copy(update={"plate": plate, "selected_wells": None})
-        self.setValue(val)
+        # only the plate changes (and the selection is cleared), so build the new
+        # plan once and draw it directly, rather than going through setValue
+        self._plate = useq.WellPlate.from_str(plate_name)
+        plan = useq.WellPlatePlan(
+            plate=self._plate,
+            a1_center_xy=self._a1_center_xy,
+            rotation=self._rotation,
+        )
+        # emit valueChanged once below, rather than on the selection being cleared
+        with signals_blocked(self._view):
+            self._update_view(plan)
         self.valueChanged.emit(self.value())
 
 
@@ -239,6 +271,65 @@ class HoverEllipse(QGraphicsEllipseItem):
         super().hoverLeaveEvent(event)
 
 
+class _WellLabels(QGraphicsItem):
+    """A single item drawing the names of all the wells.
+
+    Each name is centered on the center of its well.
+    This is much cheaper to build and paint than one QGraphicsTextItem per well.
+    """
+
+    def __init__(self, font: QFont, parent: QGraphicsItem | None = None):
+        super().__init__(parent)
+        self._font = QFont(font)
+        # size of the box each name is centered in, fitting the widest name
+        self._size = (0.0, 0.0)
+        self._labels: list[tuple[float, float, str]] = []
+        self._bounds = QRectF()
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+    def setLabels(
+        self, names: Sequence[str], xs: Sequence[float], ys: Sequence[float]
+    ) -> None:
+        """Set the `names` to draw, centered on the scene points (`xs`, `ys`)."""
+        self.prepareGeometryChange()
+        self._labels = list(zip(xs, ys, names))
+        if self._labels:
+            # names may be wider than their well, so size the box from the font
+            fm = QFontMetricsF(self._font)
+            w = max(fm.horizontalAdvance(name) for name in set(names))
+            h = fm.height()
+            self._size = (w, h)
+            left, top = min(xs) - w / 2, min(ys) - h / 2
+            self._bounds = QRectF(
+                left, top, max(xs) + w / 2 - left, max(ys) + h / 2 - top
+            )
+        else:
+            self._bounds = QRectF()
+        self.update()
+
+    def boundingRect(self) -> QRectF:
+        return self._bounds
+
+    def shape(self) -> QPainterPath:
+        # the labels cover the whole plate: make sure they are never hit by mouse
+        # events and scene queries, so that the wells underneath are found instead
+        return QPainterPath()
+
+    def paint(
+        self,
+        painter: QPainter | None,
+        option: QStyleOptionGraphicsItem | None,
+        widget: QWidget | None = None,
+    ) -> None:
+        if painter is None:  # pragma: no cover
+            return
+        painter.setFont(self._font)
+        w, h = self._size
+        flags = Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextDontClip
+        for x, y, name in self._labels:
+            painter.drawText(QRectF(x - w / 2, y - h / 2, w, h), flags, name)
+
+
 class WellPlateView(ResizingGraphicsView):
     """QGraphicsView for displaying a well plate."""
 
@@ -255,22 +346,45 @@ class WellPlateView(ResizingGraphicsView):
         self._draw_labels: bool = True
         self._draw_well_edge_spots: bool = False
 
+        # pen for the well outlines. Since most plates have the same extent,
+        # a constant pen width seems to work
+        self._well_pen = QPen(Qt.GlobalColor.black)
+        self._well_pen.setWidth(200)
+        # font for the well labels (pixel size is set in drawPlate)
+        self._label_font = QFont()
+
         self.setStyleSheet("background:grey; border-radius: 5px;")
         self.setRenderHints(
             QPainter.RenderHint.Antialiasing | QPainter.RenderHint.SmoothPixmapTransform
         )
+        # wells are many small static items: only repaint the regions that changed,
+        # and skip saving/restoring the painter state around each item
+        self.setViewportUpdateMode(self.ViewportUpdateMode.SmartViewportUpdate)
+        self.setOptimizationFlag(self.OptimizationFlag.DontSavePainterState)
         # RubberBandDrag enables rubber band selection with mouse
         self.setDragMode(self.DragMode.RubberBandDrag)
         self.rubberBandChanged.connect(self._on_rubber_band_changed)
 
         # all the graphics items that outline wells
         self._well_items: dict[tuple[int, int], QAbstractGraphicsShapeItem] = {}
-        # all the graphics items that label wells
-        self._well_labels: list[QGraphicsItem] = []
+        # the graphics item that labels all the wells
+        self._well_labels: _WellLabels | None = None
         self._well_edge_spots: list[QGraphicsItem] = []
+        # the plate geometry and draw options of the items currently in the scene,
+        # used to skip rebuilding the scene when the same plate is drawn again
+        self._drawn_layout: tuple | None = None
+        # the (x, y) scene centers of the wells, in the same order as `_well_items`,
+        # used for rubber band hit-testing. None when the plate is rotated.
+        self._well_centers: np.ndarray | None = None
+        self._well_half_size: tuple[float, float] = (0, 0)
+        self._circular_wells = True
 
         # we manually manage the selection state of items
         self._selected_items: set[QAbstractGraphicsShapeItem] = set()
+        # the (row, col) indices of the selected items, kept sorted as they change
+        self._selected_indices: list[tuple[int, int]] = []
+        # the tuple returned by `selectedIndices`, until the selection changes
+        self._selected_indices_tuple: tuple[tuple[int, int], ...] | None = None
         # the set of selected items at the time of the mouse press
         self._selection_on_press: set[QAbstractGraphicsShapeItem] = set()
 
@@ -307,24 +421,71 @@ class WellPlateView(ResizingGraphicsView):
             # this is the last signal emitted when releasing the mouse
             return
 
-        # all scene items within the rubber band
-        bounded_items = set(self._scene.items(self.mapToScene(rect).boundingRect()))
+        scene_rect = self.mapToScene(rect).boundingRect()
+        if self._well_centers is not None:
+            in_band = self._wells_in_rect(scene_rect, self._well_centers)
+        else:
+            # all wells within the rubber band (only wells store an index)
+            in_band = {
+                item
+                for item in self._scene.items(scene_rect)
+                if isinstance(item, QAbstractGraphicsShapeItem)
+                and item.data(DATA_INDEX) is not None
+            }
+
+        # wells outside of the rubber band keep their state from the mouse press
+        if self._is_removing:
+            target = self._selection_on_press - in_band
+        else:
+            target = self._selection_on_press | in_band
 
-        # loop through all wells and recolor them based on their selection state
-        select = set()
-        deselect = set()
-        for item in self._well_items.values():
-            if item in bounded_items:
-                if self._is_removing:
-                    deselect.add(item)
-                else:
-                    select.add(item)
-            # if the item is not in the rubber band, keep its previous state
-            elif item in self._selection_on_press:
-                select.add(item)
-            else:
-                deselect.add(item)
-        self._change_selection(select, deselect)
+        # only recolor the wells whose selection state actually changes
+        selected = self._selected_items
+        self._change_selection(target - selected, selected - target)
+
+    def _wells_in_rect(
+        self, rect: QRectF, centers: np.ndarray
+    ) -> set[QAbstractGraphicsShapeItem]:
+        """Return the (unrotated) wells whose outline intersects `rect`.
+
+        This is approximately the same as querying the scene for the items in `rect`
+        (it may differ for rects right at a well outline), but done with numpy against
+        the known well centers, which is much faster when called on every move of
+        the rubber band.
+        """
+        half_w, half_h = self._well_half_size
+        cx, cy = centers[:, 0], centers[:, 1]
+        if self._circular_wells:
+            # distance from the center of each well to the closest point in rect
+            dx = (np.clip(cx, rect.left(), rect.right()) - cx) / half_w
+            dy = (np.clip(cy, rect.top(), rect.bottom()) - cy) / half_h
+            inside = dx * dx + dy * dy <= 1
+        else:
+            inside = (
+                (cx + half_w >= rect.left())
+                & (cx - half_w <= rect.right())
+                & (cy + half_h >= rect.top())
+                & (cy - half_h <= rect.bottom())
+            )
+        items = list(self._well_items.values())
+        return {items[i] for i in np.flatnonzero(inside)}
+
+    def _set_well_centers(self, plan: useq.WellPlatePlan, coords: np.ndarray) -> None:
+        """Store the screen centers of the wells used for rubber band hit-testing.
+
+        Rotated wells are not axis-aligned, so they are left to the scene.
+        """
+        if plan.rotation:
+            self._well_centers = None
+            return
+        self._well_centers = np.column_stack((coords[:, 1], -coords[:, 0]))
+        # include the outer half of the outline, as Qt does
+        half_pen = self._well_pen.widthF() / 2
+        self._well_half_size = (
+            plan.plate.well_size[0] * 1000 / 2 + half_pen,
+            plan.plate.well_size[1] * 1000 / 2 + half_pen,
+        )
+        self._circular_wells = plan.plate.circular_wells
 
     def mousePressEvent(self, event: QMouseEvent | None) -> None:
         if event and event.button() == Qt.MouseButton.LeftButton:
@@ -374,7 +535,9 @@ class WellPlateView(ResizingGraphicsView):
 
     def selectedIndices(self) -> tuple[tuple[int, int], ...]:
         """Return the indices of the selected wells."""
-        return tuple(sorted(item.data(DATA_INDEX) for item in self._selected_items))
+        if self._selected_indices_tuple is None:
+            self._selected_indices_tuple = tuple(self._selected_indices)
+        return self._selected_indices_tuple
 
     def setSelectedIndices(self, indices: Iterable[tuple[int, int]]) -> None:
         """Select the wells with the given indices.
@@ -385,15 +548,11 @@ class WellPlateView(ResizingGraphicsView):
             The indices of the wells to select. Each index is a tuple of row and column.
             e.g. [(0, 0), (1, 1), (2, 2)]
         """
-        _indices = {tuple(idx) for idx in indices}
-        select = set()
-        deselect = set()
-        for item in self._well_items.values():
-            if item.data(DATA_INDEX) in _indices:
+        select: set[QAbstractGraphicsShapeItem] = set()
+        for idx in indices:
+            if item := self._well_items.get(tuple(idx)):  # type: ignore [arg-type]
                 select.add(item)
-            else:
-                deselect.add(item)
-        self._change_selection(select, deselect)
+        self._change_selection(select, self._selected_items - select)
 
     def clearSelection(self) -> None:
         """Clear the current selection."""
@@ -401,13 +560,22 @@ class WellPlateView(ResizingGraphicsView):
 
     def clear(self) -> None:
         """Clear all the wells from the view."""
-        while self._well_items:
-            self._scene.removeItem(self._well_items.popitem()[1])
-        while self._well_labels:
-            self._scene.removeItem(self._well_labels.pop())
-        while self._well_edge_spots:
-            self._scene.removeItem(self._well_edge_spots.pop())
-        self.clearSelection()
+        had_selection = bool(self._selected_items)
+        # drop every reference to the items before the scene deletes them
+        self._selected_items.clear()
+        self._selected_indices.clear()
+        self._selected_indices_tuple = None
+        self._selection_on_press.clear()
+        self._pressed_item = None
+        self._well_items.clear()
+        self._well_labels = None
+        self._well_edge_spots.clear()
+        self._drawn_layout = None
+        self._well_centers = None
+        # remove (and delete) all the items in one sweep
+        self._scene.clear()
+        if had_selection:
+            self.selectionChanged.emit()
 
     def drawPlate(self, plan: useq.WellPlate | useq.WellPlatePlan) -> None:
         """Draw the well plate on the view.
@@ -421,6 +589,27 @@ class WellPlateView(ResizingGraphicsView):
         if isinstance(plan, useq.WellPlate):  # pragma: no cover
             plan = useq.WellPlatePlan(a1_center_xy=(0, 0), plate=plan)
 
+        layout = (
+            plan.plate,
+            plan.a1_center_xy,
+            plan.rotation,
+            self._draw_labels,
+            self._draw_well_edge_spots,
+        )
+        if self._well_items and self._drawn_layout is not None:
+            if layout == self._drawn_layout:
+                # the scene already shows this plate: just reset colors and selection
+                self.setSelectionFromPlan(plan)
+                return
+            drawn = self._drawn_layout
+            if not self._draw_well_edge_spots and (
+                layout[:2] + layout[3:] == drawn[:2] + drawn[3:]
+            ):
+                # only the rotation changed: move the existing items
+                self._move_wells(plan)
+                self.setSelectionFromPlan(plan)
+                return
+
         well_width = plan.plate.well_size[0] * 1000
         well_height = plan.plate.well_size[1] * 1000
         well_rect = QRectF(-well_width / 2, -well_height / 2, well_width, well_height)
@@ -428,24 +617,35 @@ class WellPlateView(ResizingGraphicsView):
             self._scene.addEllipse if plan.plate.circular_wells else self._scene.addRect
         )
 
-        # font for well labels
-        font = QFont()
-        font.setPixelSize(int(min(6000, well_rect.width() / 2.5)))
+        font = self._label_font
+        if (font_size := int(min(6000, well_rect.width() / 2.5))) != font.pixelSize():
+            font.setPixelSize(font_size)
+        pen = self._well_pen
 
-        # Since most plates have the same extent, a constant pen width seems to work
-        pen = QPen(Qt.GlobalColor.black)
-        pen.setWidth(200)
-
-        self.clear()
-        indices = plan.all_well_indices.reshape(-1, 2)
-        for idx, pos in zip(indices, plan.all_well_positions):
-            # invert y-axis for screen coordinates
-            screen_x, screen_y = pos.x, -cast("float", pos.y)
-            rect = well_rect.translated(screen_x, screen_y)
+        # clearing and restoring the selection below would each emit selectionChanged,
+        # so they are blocked and the signal is emitted once at the end if needed
+        selected_before = self.selectedIndices()
+        with signals_blocked(self):
+            self.clear()
+        # don't maintain the BSP index while adding items in bulk, it's rebuilt once
+        # at the end (it speeds up hit-testing for hover, clicks and rubber band)
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        # compute all the screen coordinates (in µm, with the y-axis inverted) and
+        # indices up front with numpy, rather than per-well in the loop below
+        coords = plan.all_well_coordinates * 1000  # (y, x) in mm -> µm
+        screen_xs = coords[:, 1].tolist()
+        screen_ys = (-coords[:, 0]).tolist()
+        indices = plan.all_well_indices.reshape(-1, 2).tolist()
+        translate = well_rect.translated
+        for (row, col), pos, screen_x, screen_y in zip(
+            indices, plan.all_well_positions, screen_xs, screen_ys
+        ):
+            rect = translate(screen_x, screen_y)
             if item := add_item(rect, pen):
                 item.setData(DATA_POSITION, pos)
-                index = (idx[0], idx[1])
+                index = (row, col)
                 item.setData(DATA_INDEX, index)
+                item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
                 if plan.rotation:
                     item.setTransformOriginPoint(rect.center())
                     item.setRotation(-plan.rotation)
@@ -455,23 +655,109 @@ class WellPlateView(ResizingGraphicsView):
             # customizations that we want to make.  So we don't use...
             # item.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable)
 
-            # add text
-            if self._draw_labels:
-                if text_item := self._scene.addText(pos.name):
-                    text_item.setFont(font)
-                    br = text_item.boundingRect()
-                    text_item.setPos(
-                        screen_x - br.width() // 2, screen_y - br.height() // 2
-                    )
-                    self._well_labels.append(text_item)
-
             if self._draw_well_edge_spots:
                 self._add_preset_positions_items(rect, pos, plan)
 
+        # all the labels are drawn by a single item
+        if self._draw_labels:
+            self._well_labels = _WellLabels(font)
+            self._well_labels.setLabels(
+                [pos.name or "" for pos in plan.all_well_positions],
+                screen_xs,
+                screen_ys,
+            )
+            self._scene.addItem(self._well_labels)
+
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+        self._set_well_centers(plan, coords)
+
         if plan.selected_wells:
-            self.setSelectedIndices(plan.selected_well_indices)
+            with signals_blocked(self):
+                self.setSelectedIndices(plan.selected_well_indices)
+        if self.selectedIndices() != selected_before:
+            self.selectionChanged.emit()
+
+        self._drawn_layout = layout
+        self._resize_to_fit(self._plate_scene_rect(plan, coords))
 
-        self._resize_to_fit()
+    def applyRotation(self, angle: float) -> None:
+        """Rotate the currently drawn plate by `angle` degrees.
+
+        Unlike `drawPlate`, the existing well items are moved in place, and the
+        current selection and well colors are preserved.
+        """
+        if self._drawn_layout is None:
+            return
+        plate, a1_center_xy, rotation = self._drawn_layout[:3]
+        if (rotation or 0) == (angle or 0):
+            return
+        if self._draw_well_edge_spots:
+            # the edge spots store rotated stage positions, so they are rebuilt.
+            # Passing the current selection in the plan lets drawPlate restore it
+            # without emitting selectionChanged.
+            colors = {
+                idx: color
+                for idx, item in self._well_items.items()
+                if (color := item.data(DATA_COLOR)) is not None
+            }
+            plan = useq.WellPlatePlan(
+                plate=plate,
+                a1_center_xy=a1_center_xy,
+                rotation=angle or None,
+                selected_wells=tuple(zip(*self.selectedIndices())) or None,
+            )
+            self.drawPlate(plan)
+            for (row, col), color in colors.items():
+                self.setWellColor(row, col, color)
+        else:
+            self._move_wells(
+                useq.WellPlatePlan(
+                    plate=plate, a1_center_xy=a1_center_xy, rotation=angle or None
+                )
+            )
+
+    def setSelectionFromPlan(self, plan: useq.WellPlatePlan) -> None:
+        """Reset the well colors and select the wells selected in `plan`.
+
+        The plate in `plan` is expected to be the one currently drawn.
+        """
+        self._reset_well_colors()
+        self.setSelectedIndices(
+            plan.selected_well_indices if plan.selected_wells else ()
+        )
+
+    def _move_wells(self, plan: useq.WellPlatePlan) -> None:
+        """Move the existing well items (and labels) to the positions in `plan`.
+
+        `plan` must have the same plate and a1 center as the one currently drawn.
+        """
+        coords = plan.all_well_coordinates * 1000  # (y, x) in mm -> µm
+        screen_xs = coords[:, 1].tolist()
+        screen_ys = (-coords[:, 0]).tolist()
+        rotation = -(plan.rotation or 0)
+        # items were added in the same order as `all_well_positions`
+        for item, pos, screen_x, screen_y in zip(
+            self._well_items.values(), plan.all_well_positions, screen_xs, screen_ys
+        ):
+            # the item's rect is fixed at the position it was created at,
+            # so move the item by the offset from there
+            center = item.boundingRect().center()
+            item.setPos(screen_x - center.x(), screen_y - center.y())
+            item.setTransformOriginPoint(center)
+            item.setRotation(rotation)
+            item.setData(DATA_POSITION, pos)
+        if self._well_labels is not None:
+            self._well_labels.setLabels(
+                [pos.name or "" for pos in plan.all_well_positions],
+                screen_xs,
+                screen_ys,
+            )
+
+        self._set_well_centers(plan, coords)
+        if self._drawn_layout is not None:
+            layout = self._drawn_layout
+            self._drawn_layout = (*layout[:2], plan.rotation, *layout[3:])
+        self._resize_to_fit(self._plate_scene_rect(plan, coords))
 
     def _add_preset_positions_items(
         self,
@@ -523,21 +809,75 @@ class WellPlateView(ResizingGraphicsView):
             self._scene.addItem(item)
             self._well_edge_spots.append(item)
 
-    def _resize_to_fit(self) -> None:
-        self.setSceneRect(self._scene.itemsBoundingRect())
+    def _plate_scene_rect(self, plan: useq.WellPlatePlan, coords: np.ndarray) -> QRectF:
+        """Return the bounding rect of the items drawn for `plan`.
+
+        This is the same as `itemsBoundingRect()` of the scene, but computed from the
+        well coordinates (in µm) rather than by visiting every item in the scene.
+        """
+        plate = plan.plate
+        half_w = plate.well_size[0] * 1000 / 2
+        half_h = plate.well_size[1] * 1000 / 2
+        rad = np.deg2rad(plan.rotation or 0)
+        cos, sin = abs(np.cos(rad)), abs(np.sin(rad))
+
+        # bounding rect of each well (including the outline), rotated about its center
+        half_pen = self._well_pen.widthF() / 2
+        extent_x = (half_w + half_pen) * cos + (half_h + half_pen) * sin
+        extent_y = (half_w + half_pen) * sin + (half_h + half_pen) * cos
+        if self._draw_well_edge_spots:
+            # the spots are centered on the (rotated) edges of the wells,
+            # see `_add_preset_positions_items`
+            spot_r = (
+                min(
+                    plate.well_spacing[0] * 1000 / 2 - half_w,
+                    plate.well_spacing[1] * 1000 / 2 - half_h,
+                )
+                / 2
+                + 0.5
+            )  # + half of the default pen width of the spots
+            extent_x = max(extent_x, max(half_w * cos, half_h * sin) + spot_r)
+            extent_y = max(extent_y, max(half_w * sin, half_h * cos) + spot_r)
+
+        xs, ys = coords[:, 1], -coords[:, 0]
+        left, top = xs.min() - extent_x, ys.min() - extent_y
+        rect = QRectF(left, top, xs.max() + extent_x - left, ys.max() + extent_y - top)
+        if self._well_labels is not None:
+            # the labels are not rotated, and may be wider than their wells
+            rect = rect.united(self._well_labels.boundingRect())
+        return rect
+
+    def _resize_to_fit(self, rect: QRectF) -> None:
+        self.setSceneRect(rect)
         self.resizeEvent(None)
 
+    def _reset_well_colors(self) -> None:
+        """Remove any color set with `setWellColor` from all the wells.
+
+        Every well is recolored from its selection state, so that changes to the
+        selected/unselected colors since the wells were drawn are applied too.
+        """
+        for item in self._well_items.values():
+            item.setData(DATA_COLOR, None)
+            selected = item.data(DATA_SELECTED)
+            item.setBrush(self._selected_color if selected else self._unselected_color)
+
     def _change_selection(
         self,
         select: Iterable[QAbstractGraphicsShapeItem],
         deselect: Iterable[QAbstractGraphicsShapeItem],
     ) -> None:
-        before = self._selected_items.copy()
+        changed = False
+        indices = self._selected_indices
 
         for item in select:
+            if item.data(DATA_SELECTED):
+                continue
             color = item.data(DATA_COLOR) or self._selected_color
             item.setBrush(color)
             item.setData(DATA_SELECTED, True)
+            insort(indices, item.data(DATA_INDEX))
+            changed = True
         self._selected_items.update(select)
 
         for item in deselect:
@@ -545,9 +885,12 @@ class WellPlateView(ResizingGraphicsView):
                 color = item.data(DATA_COLOR) or self._unselected_color
                 item.setBrush(color)
                 item.setData(DATA_SELECTED, False)
+                del indices[bisect_left(indices, item.data(DATA_INDEX))]
+                changed = True
         self._selected_items.difference_update(deselect)
 
-        if before != self._selected_items:
+        if changed:
+            self._selected_indices_tuple = None
             self.selectionChanged.emit()
 
     def sizeHint(self) -> QSize:
@@ -98,6 +98,19 @@ class RelativePointPlanSelector(QWidget):
         self._mode_btn_group.addButton(self.random_radio_btn)
         self._mode_btn_group.addButton(self.grid_radio_btn)
 
+        # the plan type and widget of each radio button, used when toggling
+        self._btn_to_plan: dict[
+            QRadioButton,
+            tuple[
+                type[RelativePointPlan],
+                RelativePositionWidget | RandomPointWidget | GridRowColumnWidget,
+            ],
+        ] = {
+            self.single_radio_btn: (useq.RelativePosition, self.single_pos_wdg),
+            self.random_radio_btn: (useq.RandomPoints, self.random_points_wdg),
+            self.grid_radio_btn: (useq.GridRowsColumns, self.grid_wdg),
+        }
+
         self.fov_w = _FovWidget()
         self.fov_h = _FovWidget()
 
@@ -191,21 +204,11 @@ class RelativePointPlanSelector(QWidget):
     # _________________________PRIVATE METHODS_________________________ #
 
     def _on_radiobutton_toggled(self, btn: QRadioButton, checked: bool) -> None:
-        btn2wdg: dict[QRadioButton, QWidget] = {
-            self.single_radio_btn: self.single_pos_wdg,
-            self.random_radio_btn: self.random_points_wdg,
-            self.grid_radio_btn: self.grid_wdg,
-        }
-        wdg = btn2wdg[btn]
+        plan_type, wdg = self._btn_to_plan[btn]
         wdg.setEnabled(checked)
         if checked:
             self._active_plan_widget = wdg
-            d: dict[QRadioButton, type[RelativePointPlan]] = {
-                self.single_radio_btn: useq.RelativePosition,
-                self.random_radio_btn: useq.RandomPoints,
-                self.grid_radio_btn: useq.GridRowsColumns,
-            }
-            self._active_plan_type = d[btn]
+            self._active_plan_type = plan_type
             self._on_value_changed()
 
     def _on_value_changed(self) -> None:
@@ -32,3 +32,23 @@ def test_hcs_wizard(qtbot: QtBot, global_mmcore: CMMCorePlus) -> None:
 
     # we haven't done anything, the plan should be the same
     assert wdg.value() == plan
+
+
+def test_hcs_wizard_plate_change_after_set_value(
+    qtbot: QtBot, global_mmcore: CMMCorePlus
+) -> None:
+    wdg = HCSWizard(mmcore=global_mmcore)
+    qtbot.addWidget(wdg)
+    start_plate = wdg.plate_page.widget.value().plate.name
+    other_plate = "96-well" if start_plate != "96-well" else "24-well"
+
+    # setValue doesn't necessarily go through the plate page's valueChanged...
+    wdg.setValue(useq.WellPlatePlan(plate=other_plate, a1_center_xy=(0, 0)))
+    assert wdg.calibration_page.widget.value().plate.name == other_plate
+
+    # ...but switching back to the initial plate must still resync calibration
+    wdg.plate_page.widget.plate_name.setCurrentText(start_plate)
+    assert wdg.plate_page.widget.value().plate.name == start_plate
+    calib_plan = wdg.calibration_page.widget.value()
+    assert calib_plan is not None
+    assert calib_plan.plate.name == start_plate
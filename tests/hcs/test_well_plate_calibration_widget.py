@@ -117,8 +117,8 @@ def test_plate_calibration_items(global_mmcore: CMMCorePlus, qtbot) -> None:
     # set the plan so that the plate is calibrated
     wdg.setValue(useq.WellPlatePlan(plate="96-well", a1_center_xy=(0, 0)))
     assert scene.items()
-    # we should have 96 QGraphicsEllipseItem wells, each with a QGraphicsTextItem
-    assert len(scene.items()) == 96 * 2
+    # we should have 96 QGraphicsEllipseItem wells, and a single item for the labels
+    assert len(scene.items()) == 96 + 1
 
     assert scene_test.items()
     # we should have 96 QGraphicsEllipseItem wells, each with 5 HoverWellItem
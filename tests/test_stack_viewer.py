@@ -38,7 +38,7 @@ def test_acquisition(qtbot: QtBot) -> None:
 
     mmcore.mda.run(sequence)
     qtbot.wait(10)
-    assert canvas.images[(("c", 0), ("g", 0))]._data.flatten()[0] != 0
+    assert canvas.images[(("c", 0), ("g", 0))]._data.flat[0] != 0
     assert canvas.images[(("c", 1), ("g", 0))]._data.shape == (512, 512)
     assert len(canvas.channel_row.boxes) == sequence.sizes.get("c", 1)
     assert len(canvas.sliders) > 0
@@ -53,7 +53,7 @@ def test_init_with_sequence(qtbot: QtBot) -> None:
     mmcore.mda.run(sequence)
     qtbot.wait(10)
 
-    assert canvas.images[(("c", 0), ("g", 0))]._data.flatten()[0] != 0
+    assert canvas.images[(("c", 0), ("g", 0))]._data.flat[0] != 0
     assert canvas.images[(("c", 1), ("g", 0))]._data.shape == (512, 512)
     # Now only the necessary sliders/boxes should have been initialized
     assert len(canvas.channel_row.boxes) == sequence.sizes.get("c", 1)
@@ -6,9 +6,10 @@ import pytest
 import qtpy
 import useq
 from qtpy.QtCore import Qt
-from qtpy.QtGui import QMouseEvent
+from qtpy.QtGui import QColor, QFontMetricsF, QMouseEvent
 
 from pymmcore_widgets.useq_widgets import WellPlateWidget
+from pymmcore_widgets.useq_widgets._well_plate_widget import WellPlateView
 
 if TYPE_CHECKING:
     from pytestqt.qtbot import QtBot
@@ -114,3 +115,167 @@ def test_plate_mouse_press(qtbot: QtBot) -> None:
     with qtbot.waitSignal(wdg._view.selectionChanged):
         wdg._view._on_rubber_band_changed(wdg.rect())
     assert len(wdg._view._selected_items) == 0
+
+
+def test_plate_view_redraw_same_plate(qtbot: QtBot) -> None:
+    wdg = WellPlateWidget(BASIC_PLAN)
+    qtbot.addWidget(wdg)
+    view = wdg._view
+    items = dict(view._well_items)
+    view.setWellColor(0, 0, Qt.GlobalColor.red)
+
+    # drawing the same plate again reuses the scene items...
+    view.drawPlate(BASIC_PLAN.plate)
+    assert view._well_items == items
+    # ...but resets selection and well colors
+    assert not view.selectedIndices()
+    assert view._well_items[(0, 0)].brush().color() != Qt.GlobalColor.red
+
+    view.drawPlate(BASIC_PLAN)
+    expected = tuple(map(tuple, BASIC_PLAN.selected_well_indices.tolist()))
+    assert view.selectedIndices() == expected
+
+    # a different geometry rebuilds the scene
+    view.drawPlate(useq.WellPlatePlan(plate="96-well", a1_center_xy=(1, 1)))
+    assert view._well_items != items
+
+
+def test_plate_view_apply_rotation(qtbot: QtBot) -> None:
+    wdg = WellPlateWidget(ROTATED_PLAN)
+    qtbot.addWidget(wdg)
+    view = wdg._view
+    items = dict(view._well_items)
+    selected = view.selectedIndices()
+
+    # rotating moves the existing items and keeps the selection
+    wdg._show_rotation_cb.setChecked(False)
+    assert view._well_items == items
+    assert view.selectedIndices() == selected
+    assert all(item.rotation() == 0 for item in items.values())
+
+    # the items end up where a full redraw would have put them
+    moved = {idx: item.sceneBoundingRect() for idx, item in items.items()}
+    view.clear()
+    view.drawPlate(BASIC_PLAN)
+    for idx, item in view._well_items.items():
+        assert item.sceneBoundingRect() == moved[idx]
+
+
+@pytest.mark.parametrize("plan", [BASIC_PLAN, ROTATED_PLAN, CUSTOM_PLATE, "1536-well"])
+@pytest.mark.parametrize("edge_spots", [False, True])
+def test_plate_view_scene_rect(qtbot: QtBot, plan: Any, edge_spots: bool) -> None:
+    view = WellPlateView()
+    qtbot.addWidget(view)
+    view.setDrawWellEdgeSpots(edge_spots)
+    if isinstance(plan, useq.WellPlate):
+        plan = useq.WellPlatePlan(plate=plan, a1_center_xy=(0, 0), rotation=90)
+    elif isinstance(plan, str):
+        plan = useq.WellPlatePlan(plate=plan, a1_center_xy=(0, 0))
+    view.drawPlate(plan)
+    # the scene rect is computed from the plan, it should match the items
+    assert view.sceneRect() == view.scene().itemsBoundingRect()
+
+
+def test_plate_view_draw_emits_once(qtbot: QtBot) -> None:
+    view = WellPlateView()
+    qtbot.addWidget(view)
+    view.drawPlate(BASIC_PLAN)
+
+    emitted: list[None] = []
+    view.selectionChanged.connect(lambda: emitted.append(None))
+    # a new plate with a different selection: clear + restore, but a single signal
+    view.drawPlate(useq.WellPlatePlan(plate="24-well", a1_center_xy=(0, 0)))
+    assert len(emitted) == 1
+    # same (empty) selection: no signal
+    view.drawPlate(useq.WellPlatePlan(plate="96-well", a1_center_xy=(0, 0)))
+    assert len(emitted) == 1
+
+
+def test_plate_name_change_emits_once(qtbot: QtBot) -> None:
+    wdg = WellPlateWidget(BASIC_PLAN)
+    qtbot.addWidget(wdg)
+
+    values: list[useq.WellPlatePlan] = []
+    wdg.valueChanged.connect(values.append)
+    wdg.plate_name.setCurrentText("24-well")
+    assert len(values) == 1
+    assert values[0].plate.name == "24-well"
+    assert not values[0].selected_well_indices.size
+    assert wdg.value() == values[0]
+
+
+def test_plate_view_labels_not_clipped(qtbot: QtBot) -> None:
+    view = WellPlateView()
+    qtbot.addWidget(view)
+    plan = useq.WellPlatePlan(plate="1536-well", a1_center_xy=(0, 0))
+    view.drawPlate(plan)
+
+    # on this plate some labels are wider than the wells: the labels item must
+    # cover the full width of the widest one, centered on the last column
+    labels = view._well_labels
+    assert labels is not None
+    widest = QFontMetricsF(view._label_font).horizontalAdvance("AF48")
+    assert widest > plan.plate.well_size[0] * 1000
+    last_x = plan.all_well_coordinates[:, 1].max() * 1000
+    assert labels.boundingRect().right() >= last_x + widest / 2
+
+
+def test_plate_view_redraw_applies_selected_color(qtbot: QtBot) -> None:
+    view = WellPlateView()
+    qtbot.addWidget(view)
+    plan = useq.WellPlatePlan(
+        plate="96-well", a1_center_xy=(0, 0), selected_wells=((0,), (0,))
+    )
+    view.drawPlate(plan)
+
+    # redrawing the same plan reuses the items, but must use the new color
+    view.setSelectedColor(Qt.GlobalColor.yellow)
+    view.drawPlate(plan)
+    assert view.selectedIndices() == ((0, 0),)
+    assert view._well_items[(0, 0)].brush().color() == QColor(Qt.GlobalColor.yellow)
+
+
+def test_plate_view_apply_rotation_edge_spots(qtbot: QtBot) -> None:
+    view = WellPlateView()
+    qtbot.addWidget(view)
+    view.setDrawWellEdgeSpots(True)
+    view.drawPlate(useq.WellPlatePlan(plate="96-well", a1_center_xy=(0, 0)))
+    view.setSelectedIndices([(0, 0), (1, 1)])
+    view.setWellColor(2, 2, Qt.GlobalColor.red)
+
+    emitted: list[tuple] = []
+    view.selectionChanged.connect(lambda: emitted.append(view.selectedIndices()))
+    # with edge spots the scene is rebuilt, but selection and colors are kept
+    view.applyRotation(10)
+    assert not emitted
+    assert view.selectedIndices() == ((0, 0), (1, 1))
+    assert view._well_items[(2, 2)].brush().color() == QColor(Qt.GlobalColor.red)
+    assert all(item.rotation() == -10 for item in view._well_items.values())
+
+
+@pytest.mark.parametrize("plate", ["96-well", CUSTOM_PLATE])
+def test_plate_view_wells_in_rect(qtbot: QtBot, plate: Any) -> None:
+    from qtpy.QtCore import QRectF
+
+    from pymmcore_widgets.useq_widgets._well_plate_widget import DATA_INDEX
+
+    view = WellPlateView()
+    qtbot.addWidget(view)
+    plan = useq.WellPlatePlan(plate=plate, a1_center_xy=(0, 0))
+    view.drawPlate(plan)
+    assert view._well_centers is not None
+
+    # rects spanning from the center of one well to the center (or to the gap
+    # after) another, away from the well outlines where the two may differ
+    spacing_x, spacing_y = (s * 1000 for s in plan.plate.well_spacing)
+    centers = view._well_centers
+    for i, j in [(0, 0), (0, 13), (5, 40), (17, 95), (50, 60)]:
+        (x0, y0), (x1, y1) = centers[i], centers[j]
+        for dx, dy in [(0, 0), (spacing_x / 2, spacing_y / 2)]:
+            rect = QRectF(x0, y0, x1 - x0 + dx + 1, y1 - y0 + dy + 1).normalized()
+            expected = {
+                item
+                for item in view.scene().items(rect)
+                if item.data(DATA_INDEX) is not None
+            }
+            assert view._wells_in_rect(rect, centers) == expected